@@ -0,0 +1,369 @@
+"""
+In-process caches for the MCP server hot paths.
+
+RAG traffic tends to repeat itself: the same or near-identical queries arrive
+over and over, so a small proximity cache keyed on the query embedding can
+answer a large fraction of reads without a Qdrant round-trip.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    LRU cache of document embeddings keyed by model name + content SHA-256.
+
+    Re-indexing, edits, and retry loops repeatedly embed identical content;
+    caching by content hash turns those stores into pure Qdrant upserts.
+
+    :param capacity: Maximum number of cached embeddings.
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        self.capacity = capacity
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+
+    @staticmethod
+    def _key(model_name: str, content: str) -> str:
+        return f"{model_name}:{hashlib.sha256(content.encode()).hexdigest()}"
+
+    def get(self, model_name: str, content: str) -> list[float] | None:
+        """Return the cached embedding for content, or None if not cached."""
+        key = self._key(model_name, content)
+        vector = self._entries.get(key)
+        if vector is not None:
+            self._entries.move_to_end(key)
+        return vector
+
+    def put(self, model_name: str, content: str, vector: list[float]) -> None:
+        """Cache the embedding for content, evicting the LRU entry if full."""
+        if len(self._entries) >= self.capacity:
+            self._entries.popitem(last=False)
+        self._entries[self._key(model_name, content)] = vector
+
+
+class ExactQueryCache:
+    """
+    TTL'd LRU cache keyed by the raw query string for exact repeats.
+
+    Interactive UIs and retries resend identical queries verbatim; answering
+    those from a plain dict lookup skips the embedder and Qdrant entirely.
+    Keys are tuples whose first element is the collection name, so write
+    invalidation can drop everything for a collection.
+
+    :param capacity: Maximum number of cached queries.
+    :param ttl: Seconds before a cached result expires.
+    """
+
+    def __init__(self, capacity: int = 512, ttl: float = 60.0):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+
+    def get(self, key: tuple) -> object | None:
+        """Return the cached value for a key, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        timestamp, value = entry
+        if time.monotonic() - timestamp > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: tuple, value: object) -> None:
+        """Cache a value, evicting the LRU entry if full."""
+        if len(self._entries) >= self.capacity:
+            self._entries.popitem(last=False)
+        self._entries[key] = (time.monotonic(), value)
+
+    def invalidate_collection(self, collection_name: str) -> None:
+        """Drop all cached queries for a collection (called after writes)."""
+        for key in [k for k in self._entries if k[0] == collection_name]:
+            del self._entries[key]
+
+
+class ProductQuantizer:
+    """
+    Pure-NumPy product quantizer for cache vectors.
+
+    Vectors are split into fixed-size subvectors and each subvector is mapped
+    to its nearest of 256 learned centroids, giving one byte per subvector
+    (~32x compression for 8-dim subvectors). Lookups score all cached codes
+    with a per-query distance table instead of touching full vectors.
+
+    :param subvector_size: Dimensions per subvector (vectors are zero-padded
+                           to a multiple of this).
+    :param n_codes: Number of centroids per subspace (max 256 for uint8 codes).
+    :param kmeans_iters: k-means iterations used during training.
+    """
+
+    def __init__(self, subvector_size: int = 8, n_codes: int = 256, kmeans_iters: int = 10):
+        self.subvector_size = subvector_size
+        self.n_codes = n_codes
+        self.kmeans_iters = kmeans_iters
+        # (M, n_codes, subvector_size) after training
+        self._codebooks: np.ndarray | None = None
+
+    @property
+    def trained(self) -> bool:
+        return self._codebooks is not None
+
+    def _split(self, vectors: np.ndarray) -> np.ndarray:
+        """Zero-pad and reshape (N, dim) vectors into (N, M, subvector_size)."""
+        if vectors.ndim == 1:
+            vectors = vectors[None, :]
+        remainder = vectors.shape[1] % self.subvector_size
+        if remainder:
+            vectors = np.pad(vectors, ((0, 0), (0, self.subvector_size - remainder)))
+        return vectors.reshape(vectors.shape[0], -1, self.subvector_size)
+
+    def train(self, samples: np.ndarray) -> None:
+        """Learn per-subspace codebooks from sample vectors via k-means."""
+        split = self._split(np.asarray(samples, dtype=np.float32))
+        n_samples, m, _ = split.shape
+        n_codes = min(self.n_codes, n_samples)
+        rng = np.random.default_rng(0)
+
+        codebooks = []
+        for sub in range(m):
+            data = split[:, sub, :]
+            centroids = data[rng.choice(n_samples, size=n_codes, replace=False)].copy()
+            for _ in range(self.kmeans_iters):
+                # Assign each sample to its nearest centroid, then recenter
+                distances = ((data[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+                assignment = distances.argmin(axis=1)
+                for code in range(n_codes):
+                    members = data[assignment == code]
+                    if len(members):
+                        centroids[code] = members.mean(axis=0)
+            codebooks.append(centroids)
+        self._codebooks = np.stack(codebooks)
+
+    def encode(self, vector: np.ndarray) -> np.ndarray:
+        """Encode a vector into uint8 codes, one per subvector."""
+        assert self._codebooks is not None
+        split = self._split(np.asarray(vector, dtype=np.float32))[0]
+        distances = ((split[:, None, :] - self._codebooks) ** 2).sum(axis=2)
+        return distances.argmin(axis=1).astype(np.uint8)
+
+    def similarities(self, codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Approximate dot products between coded vectors and a raw query."""
+        assert self._codebooks is not None
+        query_split = self._split(np.asarray(query, dtype=np.float32))[0]
+        # (M, n_codes) table of subspace dot products, then a table lookup per code
+        table = np.einsum("mkd,md->mk", self._codebooks, query_split)
+        if codes.ndim == 1:
+            codes = codes[None, :]
+        m = codes.shape[1]
+        return table[np.arange(m)[None, :], codes].sum(axis=1)
+
+
+class ProximityCache:
+    """
+    LRU cache that maps query embeddings to search results, per collection.
+
+    Lookups compute cosine distance between the incoming query vector and all
+    cached vectors for the same collection (a single NumPy matrix-vector
+    product); if the best match is within ``threshold`` the cached results are
+    returned without touching Qdrant.
+
+    Cached vectors can be stored as int8 (scaled by 127, valid because the
+    keys are normalized) which shrinks the cache footprint 4x and speeds up
+    the distance scan on large caches at a negligible recall cost.
+
+    Cached vectors can also be product-quantized ("pq"): once enough queries
+    have been seen to train the codebooks, keys shrink to one byte per
+    subvector and lookups use table-based scoring. Until training completes,
+    "pq" behaves like "float32".
+
+    :param capacity: Maximum number of cached queries per collection.
+    :param threshold: Maximum cosine distance for a cache hit.
+    :param dtype: Storage dtype for cached vectors, "int8", "float32", or "pq".
+    :param pq_train_size: Number of cached queries to collect before training
+                          the product quantizer (only used with dtype="pq").
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        threshold: float = 0.05,
+        dtype: str = "int8",
+        pq_train_size: int = 256,
+    ):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.dtype = dtype
+        self.pq_train_size = pq_train_size
+        self._pq = ProductQuantizer() if dtype == "pq" else None
+        self._pq_samples: list[np.ndarray] = []
+        # collection_name -> OrderedDict[key, (normalized vector, results, timestamp)]
+        self._entries: dict[str, OrderedDict[int, tuple[np.ndarray, object, float]]] = {}
+        # collection_name -> (key order snapshot, stacked key matrix), rebuilt lazily after mutations
+        self._matrices: dict[str, tuple[list[int], np.ndarray] | None] = {}
+        self._next_key = 0
+
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        arr = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(arr)
+        if norm > 0:
+            arr = arr / norm
+        return arr
+
+    def _encode(self, normalized: np.ndarray) -> np.ndarray:
+        """Quantize a normalized vector to the configured storage dtype."""
+        if self.dtype == "int8":
+            return np.clip(np.round(normalized * 127), -127, 127).astype(np.int8)
+        if self._pq is not None and self._pq.trained:
+            return self._pq.encode(normalized)
+        return normalized
+
+    def get(self, collection_name: str, query_vector) -> object | None:
+        """
+        Return the cached results for the closest cached query, or None if no
+        cached query is within the distance threshold.
+        """
+        entries = self._entries.get(collection_name)
+        if not entries:
+            return None
+
+        cached_matrix = self._matrices.get(collection_name)
+        if cached_matrix is None:
+            keys = list(entries.keys())
+            matrix = np.stack([vec for vec, _, _ in entries.values()])
+            cached_matrix = (keys, matrix)
+            self._matrices[collection_name] = cached_matrix
+        keys, matrix = cached_matrix
+
+        # Dispatch on the stored dtype: uint8 holds PQ codes, int8 holds
+        # scaled vectors (v * 127), float32 holds the raw normalized keys
+        query = self._normalize(query_vector)
+        if matrix.dtype == np.uint8:
+            similarities = self._pq.similarities(matrix, query)
+        elif matrix.dtype == np.int8:
+            quantized = np.clip(np.round(query * 127), -127, 127).astype(np.int32)
+            similarities = (matrix @ quantized) / (127.0 * 127.0)
+        else:
+            similarities = matrix @ query
+        distances = 1.0 - similarities
+        best = int(np.argmin(distances))
+        if distances[best] > self.threshold:
+            return None
+
+        key = keys[best]
+        entries.move_to_end(key)
+        return entries[key][1]
+
+    def put(self, collection_name: str, query_vector, results: object) -> None:
+        """Cache the results for a query vector, evicting the LRU entry if full."""
+        normalized = self._normalize(query_vector)
+        if self._pq is not None and not self._pq.trained:
+            self._pq_samples.append(normalized)
+            if len(self._pq_samples) >= self.pq_train_size:
+                self._pq.train(np.stack(self._pq_samples))
+                self._pq_samples.clear()
+                self._reencode_all()
+
+        entries = self._entries.setdefault(collection_name, OrderedDict())
+        if len(entries) >= self.capacity:
+            entries.popitem(last=False)
+        entries[self._next_key] = (self._encode(normalized), results, time.monotonic())
+        self._next_key += 1
+        self._matrices[collection_name] = None
+
+    def _reencode_all(self) -> None:
+        """Re-encode all cached float32 keys after PQ training completes."""
+        for collection_name, entries in self._entries.items():
+            for key, (vector, results, timestamp) in entries.items():
+                entries[key] = (self._encode(vector), results, timestamp)
+            self._matrices[collection_name] = None
+
+    def invalidate(self, collection_name: str) -> None:
+        """Drop all cached queries for a collection (called after writes)."""
+        self._entries.pop(collection_name, None)
+        self._matrices.pop(collection_name, None)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Drop cached queries for all cache keys starting with a prefix."""
+        for name in [n for n in self._entries if n.startswith(prefix)]:
+            self.invalidate(name)
+
+
+class CentroidCache:
+    """
+    Centroid-based query cache that groups paraphrases into clusters.
+
+    Where the proximity cache only matches near-duplicate queries, this cache
+    assigns each query to its nearest centroid; queries within the similarity
+    threshold share the cluster's cached results. Centroids are updated
+    incrementally (c += (x - c) / (n + 1)), so memory stays sub-linear in the
+    number of distinct queries. Clusters with the fewest hits are evicted
+    when the cache is full.
+
+    :param max_centroids: Maximum number of clusters per collection.
+    :param similarity_threshold: Minimum cosine similarity to join a cluster.
+    """
+
+    def __init__(self, max_centroids: int = 256, similarity_threshold: float = 0.86):
+        self.max_centroids = max_centroids
+        self.similarity_threshold = similarity_threshold
+        # collection_name -> parallel lists of (centroid, member count, hits, results)
+        self._clusters: dict[str, dict[str, list]] = {}
+
+    def _nearest(self, clusters: dict[str, list], query: np.ndarray) -> tuple[int, float]:
+        matrix = np.stack(clusters["centroids"])
+        norms = np.linalg.norm(matrix, axis=1)
+        norms[norms == 0] = 1.0
+        similarities = (matrix @ query) / norms
+        best = int(np.argmax(similarities))
+        return best, float(similarities[best])
+
+    def get(self, collection_name: str, query_vector) -> object | None:
+        """Return the cached results of the nearest cluster, or None."""
+        clusters = self._clusters.get(collection_name)
+        if not clusters or not clusters["centroids"]:
+            return None
+
+        query = ProximityCache._normalize(query_vector)
+        best, similarity = self._nearest(clusters, query)
+        if similarity < self.similarity_threshold:
+            return None
+
+        clusters["hits"][best] += 1
+        return clusters["results"][best]
+
+    def add(self, collection_name: str, query_vector, results: object) -> None:
+        """Fold a query into its nearest cluster, or start a new one."""
+        clusters = self._clusters.setdefault(
+            collection_name, {"centroids": [], "counts": [], "hits": [], "results": []}
+        )
+        query = ProximityCache._normalize(query_vector)
+
+        if clusters["centroids"]:
+            best, similarity = self._nearest(clusters, query)
+            if similarity >= self.similarity_threshold:
+                n = clusters["counts"][best]
+                clusters["centroids"][best] += (query - clusters["centroids"][best]) / (n + 1)
+                clusters["counts"][best] = n + 1
+                clusters["results"][best] = results
+                return
+
+        if len(clusters["centroids"]) >= self.max_centroids:
+            evict = int(np.argmin(clusters["hits"]))
+            for values in clusters.values():
+                values.pop(evict)
+
+        clusters["centroids"].append(query.copy())
+        clusters["counts"].append(1)
+        clusters["hits"].append(0)
+        clusters["results"].append(results)
+
+    def invalidate(self, collection_name: str) -> None:
+        """Drop all clusters for a collection (called after writes)."""
+        self._clusters.pop(collection_name, None)
@@ -34,6 +34,9 @@ class EnhancedEmbeddingModelManager:
     def __init__(self, default_settings: EmbeddingProviderSettings):
         self.default_settings = default_settings
         self._available_models: List[EmbeddingModelInfo] = []
+        # Dict indexes so model lookups are O(1) instead of scanning the list
+        self._models_by_name: dict[str, EmbeddingModelInfo] = {}
+        self._model_names_by_size: dict[int, str] = {}
         self._default_provider: EmbeddingProvider = create_embedding_provider(default_settings)
 
         self._populate_available_models()
@@ -44,14 +47,17 @@ class EnhancedEmbeddingModelManager:
             from fastembed import TextEmbedding
             supported_models = TextEmbedding.list_supported_models()
             for model in supported_models:
-                self._available_models.append(
-                    EmbeddingModelInfo(
-                        model_name=model['model'],
-                        provider_type="fastembed",
-                        vector_size=model.get('dim', 0),
-                        description=model.get('description', '')
-                    )
+                info = EmbeddingModelInfo(
+                    model_name=model['model'],
+                    provider_type="fastembed",
+                    vector_size=model.get('dim', 0),
+                    description=model.get('description', '')
                 )
+                self._available_models.append(info)
+                self._models_by_name[info.model_name] = info
+                # Keep the first model registered for each vector size, matching
+                # the previous first-match scan behavior
+                self._model_names_by_size.setdefault(info.vector_size, info.model_name)
         except Exception as e:
             logger.error(f"Failed to populate available models: {e}")
 
@@ -61,10 +67,7 @@ class EnhancedEmbeddingModelManager:
 
     def get_model_info(self, model_name: str) -> Optional[EmbeddingModelInfo]:
         """Get information about a specific model."""
-        for model in self._available_models:
-            if model.model_name == model_name:
-                return model
-        return None
+        return self._models_by_name.get(model_name)
 
     def list_available_models(self) -> List[EmbeddingModelInfo]:
         """List all available embedding models."""
@@ -72,7 +75,4 @@ class EnhancedEmbeddingModelManager:
 
     def find_model_by_vector_size(self, vector_size: int) -> Optional[str]:
         """Find a suitable model based on vector size."""
-        for model in self._available_models:
-            if model.vector_size == vector_size:
-                return model.model_name
-        return None
\ No newline at end of file
+        return self._model_names_by_size.get(vector_size)
\ No newline at end of file
@@ -1,17 +1,25 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class EmbeddingProvider(ABC):
-    """Abstract base class for embedding providers."""
+    """
+    Abstract base class for embedding providers.
+
+    Vectors are returned as float32 ndarrays rather than Python lists: a
+    1024-dim list of PyFloat objects is roughly 7x the memory of the packed
+    array, and the array form is what the caches and quantizers consume.
+    """
 
     @abstractmethod
-    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
-        """Embed a list of documents into vectors."""
+    async def embed_documents(self, documents: list[str]) -> list[np.ndarray]:
+        """Embed a list of documents into float32 vectors."""
         pass
 
     @abstractmethod
-    async def embed_query(self, query: str) -> list[float]:
-        """Embed a query into a vector."""
+    async def embed_query(self, query: str) -> np.ndarray:
+        """Embed a query into a float32 vector."""
         pass
 
     @abstractmethod
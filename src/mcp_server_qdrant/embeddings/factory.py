@@ -10,6 +10,15 @@ def create_embedding_provider(settings: EmbeddingProviderSettings) -> EmbeddingP
     :return: An instance of the specified embedding provider.
     """
     if settings.provider_type == EmbeddingProviderType.FASTEMBED:
+        if settings.use_process_pool:
+            from mcp_server_qdrant.embeddings.process_pool import (
+                ProcessPoolFastEmbedProvider,
+            )
+
+            return ProcessPoolFastEmbedProvider(
+                settings.model_name, settings.process_pool_workers
+            )
+
         from mcp_server_qdrant.embeddings.fastembed import FastEmbedProvider
 
         return FastEmbedProvider(settings.model_name)
@@ -1,5 +1,6 @@
 import asyncio
 
+import numpy as np
 from fastembed import TextEmbedding
 from fastembed.common.model_description import DenseModelDescription
 
@@ -16,23 +17,23 @@ class FastEmbedProvider(EmbeddingProvider):
         self.model_name = model_name
         self.embedding_model = TextEmbedding(model_name, device="cpu")
 
-    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+    async def embed_documents(self, documents: list[str]) -> list[np.ndarray]:
         """Embed a list of documents into vectors."""
         # Run in a thread pool since FastEmbed is synchronous
         loop = asyncio.get_event_loop()
         embeddings = await loop.run_in_executor(
             None, lambda: list(self.embedding_model.passage_embed(documents))
         )
-        return [embedding.tolist() for embedding in embeddings]
+        return [np.asarray(embedding, dtype=np.float32) for embedding in embeddings]
 
-    async def embed_query(self, query: str) -> list[float]:
+    async def embed_query(self, query: str) -> np.ndarray:
         """Embed a query into a vector."""
         # Run in a thread pool since FastEmbed is synchronous
         loop = asyncio.get_event_loop()
         embeddings = await loop.run_in_executor(
             None, lambda: list(self.embedding_model.query_embed([query]))
         )
-        return embeddings[0].tolist()
+        return np.asarray(embeddings[0], dtype=np.float32)
 
     def get_vector_name(self) -> str:
         """
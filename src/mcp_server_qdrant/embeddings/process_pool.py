@@ -0,0 +1,92 @@
+"""
+Process-pool wrapper around FastEmbed for multi-core hosts.
+
+FastEmbed holds the GIL during tokenization and pre/post-processing, which
+serializes concurrent tool calls even though the server is fully async.
+Running the model in a pool of worker processes lets concurrent find/store
+requests embed in parallel, one model instance per worker.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from fastembed import TextEmbedding
+
+from mcp_server_qdrant.embeddings.base import EmbeddingProvider
+
+# Per-worker model instance, created once by the pool initializer
+_worker_model: TextEmbedding | None = None
+
+
+def _init_worker(model_name: str) -> None:
+    global _worker_model
+    # Each worker embeds one batch at a time; keep BLAS single-threaded so
+    # the workers don't oversubscribe the cores
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+    _worker_model = TextEmbedding(model_name, device="cpu")
+
+
+def _embed_documents(documents: list[str]) -> np.ndarray:
+    # One contiguous (n, dim) float32 matrix pickles as a single packed
+    # buffer, so the IPC cost back to the server process is one memcpy
+    # instead of n separate arrays (or worse, lists of PyFloats)
+    assert _worker_model is not None
+    return np.asarray(list(_worker_model.passage_embed(documents)), dtype=np.float32)
+
+
+def _embed_query(query: str) -> np.ndarray:
+    assert _worker_model is not None
+    return np.asarray(list(_worker_model.query_embed([query]))[0], dtype=np.float32)
+
+
+class ProcessPoolFastEmbedProvider(EmbeddingProvider):
+    """
+    FastEmbed provider that embeds in a persistent worker process pool.
+    :param model_name: The name of the FastEmbed model to use.
+    :param max_workers: Number of worker processes; defaults to the CPU count.
+    """
+
+    def __init__(self, model_name: str, max_workers: int | None = None):
+        self.model_name = model_name
+        self._pool = ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(model_name,),
+        )
+
+    async def embed_documents(self, documents: list[str]) -> list[np.ndarray]:
+        """Embed a list of documents into vectors in a worker process."""
+        loop = asyncio.get_event_loop()
+        matrix = await loop.run_in_executor(self._pool, _embed_documents, documents)
+        # Row views share the matrix buffer - no per-vector copy
+        return list(matrix)
+
+    async def embed_query(self, query: str) -> np.ndarray:
+        """Embed a query into a vector in a worker process."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._pool, _embed_query, query)
+
+    def get_vector_name(self) -> str:
+        """
+        Return the name of the vector for the Qdrant collection.
+        Matches FastEmbedProvider so both providers address the same vectors.
+        """
+        model_name = self.model_name.split("/")[-1].lower()
+        return f"fast-{model_name}"
+
+    def get_vector_size(self) -> int:
+        """Get the size of the vector without loading the model in-process."""
+        model_description = TextEmbedding._get_model_description(self.model_name)
+        if model_description.dim is None:
+            raise ValueError("Model dimension (dim) is None for model: {}".format(self.model_name))
+        return model_description.dim
+
+    def get_model_name(self) -> str:
+        """Get the name of the embedding model."""
+        return self.model_name
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -4,17 +4,30 @@ Enhanced MCP server with improved embedding management and API key security.
 
 import json
 import logging
+import time
 from typing import Annotated, Any
 
 from fastmcp import Context, FastMCP
 from pydantic import Field
 from qdrant_client import models
 
+from mcp_server_qdrant.common.caching import (
+    CentroidCache,
+    EmbeddingCache,
+    ExactQueryCache,
+    ProximityCache,
+)
 from mcp_server_qdrant.common.filters import make_indexes
 from mcp_server_qdrant.common.func_tools import make_partial_function
 from mcp_server_qdrant.common.wrap_filters import wrap_filters
 from mcp_server_qdrant.embedding_manager import EnhancedEmbeddingModelManager
-from mcp_server_qdrant.qdrant import ArbitraryFilter, Entry, QdrantConnector, BatchEntry
+from mcp_server_qdrant.qdrant import (
+    ArbitraryFilter,
+    BatchEntry,
+    CollectionInfo,
+    Entry,
+    QdrantConnector,
+)
 from mcp_server_qdrant.settings import (
     EmbeddingProviderSettings,
     QdrantSettings,
@@ -23,6 +36,27 @@ from mcp_server_qdrant.settings import (
 
 logger = logging.getLogger(__name__)
 
+# Connection prefixes over which it is safe to send the API key
+_SECURE_PREFIXES = (
+    "https://",
+    "localhost",
+    "127.0.0.1",
+    "http://localhost",
+    "http://127.0.0.1",
+)
+
+# orjson serializes metadata ~3-5x faster than the stdlib; fall back if unavailable
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _dumps = json.dumps
+    _loads = json.loads
+
 
 class QdrantMCPServer(FastMCP):
     """
@@ -44,16 +78,74 @@ class QdrantMCPServer(FastMCP):
             self.qdrant_settings = qdrant_settings
             self.embedding_provider_settings = embedding_provider_settings
 
+            # Derived settings are computed once here so tool closures don't
+            # re-read settings or rebuild dicts on every invocation
+            self._search_limit = qdrant_settings.search_limit
+            self._filterable_fields = qdrant_settings.filterable_fields_dict()
+            self._filter_conditions = qdrant_settings.filterable_fields_dict_with_conditions()
+
             # Initialize enhanced embedding model manager
             self.embedding_manager = EnhancedEmbeddingModelManager(embedding_provider_settings)
 
             # Use the default provider from the simplified embedding manager
             self.embedding_provider = self.embedding_manager.get_default_provider()
 
+            # Content-hash embedding cache - identical documents are embedded once
+            self.embedding_cache: EmbeddingCache | None = None
+            if qdrant_settings.enable_embedding_cache:
+                self.embedding_cache = EmbeddingCache(
+                    capacity=qdrant_settings.embedding_cache_capacity
+                )
+
             # Initialize Qdrant connector with secure connection handling
             self.qdrant_connector = self._create_secure_qdrant_connector()
 
+            # Short-TTL cache of collection info for resource/overview handlers
+            self._collection_info_cache: dict[str, tuple[float, CollectionInfo]] = {}
+            self._collection_info_ttl = qdrant_settings.collection_info_cache_ttl
+
+            # Collection-name listing cache, invalidated by the write tools
+            self._collection_names_cache: tuple[str, ...] | None = None
+
+            # Semantic query cache - serves near-duplicate queries without a Qdrant round-trip.
+            # The exact cache sits in front and short-circuits verbatim repeats
+            # before the query is even embedded.
+            self.query_cache: ProximityCache | None = None
+            self.hybrid_query_cache: ProximityCache | None = None
+            self.exact_query_cache: ExactQueryCache | None = None
+            if self.qdrant_settings.enable_query_cache:
+                self.exact_query_cache = ExactQueryCache(
+                    capacity=self.qdrant_settings.exact_query_cache_capacity,
+                    ttl=self.qdrant_settings.exact_query_cache_ttl,
+                )
+            # The proximity caches key on locally computed query vectors, so
+            # they only apply when this process does the embedding
+            if (
+                self.qdrant_settings.enable_query_cache
+                and not self.qdrant_settings.server_side_inference
+            ):
+                self.query_cache = ProximityCache(
+                    capacity=self.qdrant_settings.query_cache_capacity,
+                    threshold=self.qdrant_settings.query_cache_threshold,
+                    dtype=self.qdrant_settings.query_cache_dtype,
+                )
+                self.hybrid_query_cache = ProximityCache(
+                    capacity=self.qdrant_settings.query_cache_capacity,
+                    threshold=self.qdrant_settings.query_cache_threshold,
+                    dtype=self.qdrant_settings.query_cache_dtype,
+                )
 
+            # Optional centroid cache layered above the proximity cache to
+            # catch paraphrases of previously answered queries
+            self.centroid_cache: CentroidCache | None = None
+            if (
+                self.qdrant_settings.enable_centroid_cache
+                and not self.qdrant_settings.server_side_inference
+            ):
+                self.centroid_cache = CentroidCache(
+                    max_centroids=self.qdrant_settings.centroid_cache_max_centroids,
+                    similarity_threshold=self.qdrant_settings.centroid_cache_similarity,
+                )
 
             super().__init__(name=name, instructions=instructions, **settings)
 
@@ -73,12 +165,9 @@ class QdrantMCPServer(FastMCP):
         location = self.qdrant_settings.location
 
         if api_key and location:
-            # Check if connection is secure
-            if not (location.startswith("https://") or
-                    location.startswith("localhost") or
-                    location.startswith("127.0.0.1") or
-                    location.startswith("http://localhost") or
-                    location.startswith("http://127.0.0.1")):
+            # Check if connection is secure - str.startswith dispatches over the
+            # prefix tuple in a single C-level call
+            if not location.startswith(_SECURE_PREFIXES):
                 logger.warning("Insecure connection detected. API key will not be sent over insecure connection.")
                 api_key = None
 
@@ -88,13 +177,73 @@ class QdrantMCPServer(FastMCP):
             self.qdrant_settings.collection_name,
             self.embedding_provider,
             self.qdrant_settings.local_path,
-            make_indexes(self.qdrant_settings.filterable_fields_dict()),
+            make_indexes(self._filterable_fields),
+            embedding_cache=self.embedding_cache,
+            prefer_grpc=self.qdrant_settings.prefer_grpc,
+            pool_size=self.qdrant_settings.pool_size,
+            server_side_inference=self.qdrant_settings.server_side_inference,
         )
 
+    async def _cached_collection_names(self) -> tuple[str, ...]:
+        """Get the collection names, re-fetching only after a write invalidated them."""
+        if self._collection_names_cache is None:
+            self._collection_names_cache = tuple(
+                await self.qdrant_connector.get_collection_names()
+            )
+        return self._collection_names_cache
+
+    async def _cached_collection_info(self, collection_name: str) -> CollectionInfo | None:
+        """Get collection info, served from the TTL cache when fresh."""
+        cached = self._collection_info_cache.get(collection_name)
+        if cached is not None and time.monotonic() - cached[0] < self._collection_info_ttl:
+            return cached[1]
+
+        info = await self.qdrant_connector.get_detailed_collection_info(collection_name)
+        if info is not None and self._collection_info_ttl > 0:
+            self._collection_info_cache[collection_name] = (time.monotonic(), info)
+        return info
+
+    async def _cached_all_collection_info(self) -> list[CollectionInfo]:
+        """Get info for every collection, served from the TTL cache when all entries are fresh."""
+        names = await self._cached_collection_names()
+        now = time.monotonic()
+        cached = [self._collection_info_cache.get(name) for name in names]
+        if cached and all(
+            entry is not None and now - entry[0] < self._collection_info_ttl
+            for entry in cached
+        ):
+            return [entry[1] for entry in cached]
+
+        # One listing plus concurrent per-collection lookups on the connector side
+        infos = await self.qdrant_connector.get_all_detailed_collection_info()
+        if self._collection_info_ttl > 0:
+            now = time.monotonic()
+            for info in infos:
+                self._collection_info_cache[info.name] = (now, info)
+        return infos
+
+    def _invalidate_query_caches(self, collection_name: str) -> None:
+        """Drop cached query results and collection metadata for a collection after a write."""
+        self._collection_info_cache.pop(collection_name, None)
+        self._collection_names_cache = None
+        if self.query_cache is not None:
+            self.query_cache.invalidate(collection_name)
+        if self.hybrid_query_cache is not None:
+            self.hybrid_query_cache.invalidate_prefix(f"{collection_name}|")
+        if self.centroid_cache is not None:
+            self.centroid_cache.invalidate(collection_name)
+        if self.exact_query_cache is not None:
+            self.exact_query_cache.invalidate_collection(collection_name)
+
     def format_entry(self, entry: Entry) -> str:
         """Format an entry for display."""
-        entry_metadata = json.dumps(entry.metadata) if entry.metadata else ""
-        return f"<entry><content>{entry.content}</content><metadata>{entry_metadata}</metadata></entry>"
+        return "".join((
+            "<entry><content>",
+            entry.content,
+            "</content><metadata>",
+            _dumps(entry.metadata) if entry.metadata else "",
+            "</metadata></entry>",
+        ))
 
     def setup_tools(self) -> None:
         """Register all tools in the server."""
@@ -110,19 +259,52 @@ class QdrantMCPServer(FastMCP):
             try:
                 filter_obj = models.Filter(**query_filter) if query_filter else None
 
-                entries = await self.qdrant_connector.search(
-                    query,
-                    collection_name=collection_name,
-                    limit=self.qdrant_settings.search_limit,
-                    query_filter=filter_obj,
-                )
+                # Exact-repeat fast path: a verbatim repeat of a recent query
+                # skips both the embedder and Qdrant
+                exact_key = (collection_name, query)
+                if self.exact_query_cache is not None and filter_obj is None:
+                    cached_content = self.exact_query_cache.get(exact_key)
+                    if cached_content is not None:
+                        return cached_content
+
+                # Consult the semantic query cache before hitting Qdrant; the
+                # query is embedded once and the vector reused for the search.
+                query_vector = None
+                if self.query_cache is not None and filter_obj is None:
+                    query_vector = await self.qdrant_connector.embed_query(query)
+                    cached = self.query_cache.get(collection_name, query_vector)
+                    if cached is None and self.centroid_cache is not None:
+                        # Fall back to the paraphrase-cluster cache
+                        cached = self.centroid_cache.get(collection_name, query_vector)
+                    if cached is not None:
+                        entries = cached
+                    else:
+                        entries = await self.qdrant_connector.search(
+                            query,
+                            collection_name=collection_name,
+                            limit=self._search_limit,
+                            query_filter=filter_obj,
+                            query_vector=query_vector,
+                        )
+                        self.query_cache.put(collection_name, query_vector, entries)
+                        if self.centroid_cache is not None:
+                            self.centroid_cache.add(collection_name, query_vector, entries)
+                else:
+                    entries = await self.qdrant_connector.search(
+                        query,
+                        collection_name=collection_name,
+                        limit=self._search_limit,
+                        query_filter=filter_obj,
+                    )
 
                 if not entries:
-                    return [f"No information found for the query '{query}'"]
+                    content = [f"No information found for the query '{query}'"]
+                else:
+                    content = [f"Results for the query '{query}'"]
+                    content.extend(self.format_entry(entry) for entry in entries)
 
-                content = [f"Results for the query '{query}'"]
-                for entry in entries:
-                    content.append(self.format_entry(entry))
+                if self.exact_query_cache is not None and filter_obj is None:
+                    self.exact_query_cache.put(exact_key, content)
                 return content
 
             except Exception as e:
@@ -145,8 +327,8 @@ class QdrantMCPServer(FastMCP):
                 parsed_metadata = None
                 if metadata:
                     try:
-                        parsed_metadata = json.loads(metadata)
-                    except json.JSONDecodeError:
+                        parsed_metadata = _loads(metadata)
+                    except ValueError:
                         return f"Invalid metadata JSON: {metadata}"
 
                 # Create entry
@@ -156,9 +338,16 @@ class QdrantMCPServer(FastMCP):
                     id=entry_id
                 )
 
-                stored_count = await self.qdrant_connector.batch_store([batch_entry], collection_name)
+                stored_count = await self.qdrant_connector.batch_store(
+                    [batch_entry],
+                    collection_name,
+                    wait=self.qdrant_settings.batch_wait,
+                    chunk_size=self.qdrant_settings.batch_chunk_size,
+                    concurrency=self.qdrant_settings.batch_concurrency,
+                )
 
                 if stored_count > 0:
+                    self._invalidate_query_caches(collection_name)
                     # Record the model mapping for this collection if not already stored
                     model_name = self.embedding_provider.get_model_name()
                     vector_size = self.embedding_provider.get_vector_size()
@@ -173,7 +362,7 @@ class QdrantMCPServer(FastMCP):
                 return f"Error storing content: {str(e)}"
 
         # Register tools with appropriate filters
-        filterable_conditions = self.qdrant_settings.filterable_fields_dict_with_conditions()
+        filterable_conditions = self._filter_conditions
 
         find_tool = find
         if len(filterable_conditions) > 0:
@@ -215,7 +404,7 @@ class QdrantMCPServer(FastMCP):
         async def list_collections(ctx: Context) -> list[str]:
             """List all available Qdrant collections."""
             try:
-                collections = await self.qdrant_connector.get_collection_names()
+                collections = await self._cached_collection_names()
                 if not collections:
                     return ["No collections found"]
                 return [f"Available collections: {', '.join(collections)}"]
@@ -230,7 +419,7 @@ class QdrantMCPServer(FastMCP):
         ) -> list[str]:
             """Get detailed information about a specific collection."""
             try:
-                info = await self.qdrant_connector.get_detailed_collection_info(collection_name)
+                info = await self._cached_collection_info(collection_name)
                 if not info:
                     return [f"Collection '{collection_name}' not found"]
 
@@ -284,6 +473,7 @@ class QdrantMCPServer(FastMCP):
                     )
 
                     if success:
+                        self._collection_names_cache = None
                         return f"Successfully created collection '{collection_name}' with vector size {vector_size}, {distance} distance, and embedding model '{embedding_model}'"
                     else:
                         return f"Failed to create collection '{collection_name}'"
@@ -305,6 +495,7 @@ class QdrantMCPServer(FastMCP):
                 try:
                     success = await self.qdrant_connector.delete_collection(collection_name)
                     if success:
+                        self._invalidate_query_caches(collection_name)
                         return f"Successfully deleted collection '{collection_name}'"
                     else:
                         return f"Failed to delete collection '{collection_name}'"
@@ -358,23 +549,55 @@ class QdrantMCPServer(FastMCP):
         ) -> list[str]:
             """Perform advanced search with similarity scores and filtering."""
             try:
-                results = await self.qdrant_connector.hybrid_search(
-                    query=query,
-                    collection_name=collection_name,
-                    limit=limit,
-                    min_score=min_score if min_score > 0 else None
-                )
+                # Exact-repeat fast path: a verbatim repeat of a recent query
+                # skips both the embedder and Qdrant
+                exact_key = (collection_name, query, limit, min_score, include_scores)
+                if self.exact_query_cache is not None:
+                    cached_content = self.exact_query_cache.get(exact_key)
+                    if cached_content is not None:
+                        return cached_content
+
+                # Hybrid results depend on limit/min_score, so those are part of the cache key
+                cache_key = f"{collection_name}|{limit}|{min_score}"
+                query_vector = None
+                if self.hybrid_query_cache is not None:
+                    query_vector = await self.qdrant_connector.embed_query(query)
+                    cached = self.hybrid_query_cache.get(cache_key, query_vector)
+                    if cached is not None:
+                        results = cached
+                    else:
+                        results = await self.qdrant_connector.hybrid_search(
+                            query=query,
+                            collection_name=collection_name,
+                            limit=limit,
+                            min_score=min_score if min_score > 0 else None,
+                            query_vector=query_vector,
+                        )
+                        self.hybrid_query_cache.put(cache_key, query_vector, results)
+                else:
+                    results = await self.qdrant_connector.hybrid_search(
+                        query=query,
+                        collection_name=collection_name,
+                        limit=limit,
+                        min_score=min_score if min_score > 0 else None
+                    )
 
                 if not results:
-                    return [f"No results found for query '{query}' in collection '{collection_name}'"]
-
-                content = [f"Hybrid search results for '{query}' in '{collection_name}':"]
-                for entry, score in results:
+                    content = [f"No results found for query '{query}' in collection '{collection_name}'"]
+                else:
+                    # Hoist the branch out of the loop and keep list building in C
+                    content = [f"Hybrid search results for '{query}' in '{collection_name}':"]
+                    format_entry = self.format_entry
                     if include_scores:
-                        content.append(f"[Score: {score:.4f}] {self.format_entry(entry)}")
+                        format_score = "[Score: {:.4f}] ".format
+                        content.extend(
+                            format_score(score) + format_entry(entry) for entry, score in results
+                        )
                     else:
-                        content.append(self.format_entry(entry))
+                        content.extend(format_entry(entry) for entry, _ in results)
 
+                if self.exact_query_cache is not None:
+                    self.exact_query_cache.put(exact_key, content)
                 return content
             except Exception as e:
                 await ctx.debug(f"Error in hybrid search: {e}")
@@ -399,8 +622,7 @@ class QdrantMCPServer(FastMCP):
                     return [f"No entries found in collection '{collection_name}'"]
 
                 content = [f"Browsing collection '{collection_name}' (showing {len(entries)} entries):"]
-                for entry in entries:
-                    content.append(self.format_entry(entry))
+                content.extend(self.format_entry(entry) for entry in entries)
 
                 if next_offset:
                     content.append(f"Next page offset: {next_offset}")
@@ -421,37 +643,42 @@ class QdrantMCPServer(FastMCP):
             ) -> str:
                 """Store multiple entries efficiently in a single batch operation."""
                 try:
-                    # Validate and convert entries
-                    batch_entries = []
+                    # Validate and convert entries in a single pass; the list is
+                    # preallocated so large batches don't pay for list growth
+                    batch_entries: list[BatchEntry] = [None] * len(entries)  # type: ignore[list-item]
                     for i, entry_dict in enumerate(entries):
-                        if "content" not in entry_dict:
+                        content = entry_dict.get("content")
+                        if content is None:
                             return f"Entry {i} missing required 'content' field"
 
                         # Parse metadata from JSON string if needed
-                        parsed_metadata = None
-                        metadata = entry_dict.get("metadata")
-                        if metadata:
-                            if isinstance(metadata, str):
-                                try:
-                                    parsed_metadata = json.loads(metadata)
-                                except json.JSONDecodeError:
-                                    return f"Entry {i}: Invalid metadata JSON: {metadata}"
-                            else:
-                                parsed_metadata = metadata
-
-                        batch_entries.append(BatchEntry(
-                            content=entry_dict["content"],
+                        parsed_metadata = entry_dict.get("metadata") or None
+                        if isinstance(parsed_metadata, str):
+                            try:
+                                parsed_metadata = _loads(parsed_metadata)
+                            except ValueError:
+                                return f"Entry {i}: Invalid metadata JSON: {parsed_metadata}"
+
+                        batch_entries[i] = BatchEntry(
+                            content=content,
                             metadata=parsed_metadata,
                             id=entry_dict.get("id")
-                        ))
+                        )
 
                     # No limit on batch size - process all entries
                     # if len(batch_entries) > self.qdrant_settings.max_batch_size:
                     #     return f"Batch size {len(batch_entries)} exceeds maximum {self.qdrant_settings.max_batch_size}"
 
-                    stored_count = await self.qdrant_connector.batch_store(batch_entries, collection_name)
+                    stored_count = await self.qdrant_connector.batch_store(
+                        batch_entries,
+                        collection_name,
+                        wait=self.qdrant_settings.batch_wait,
+                        chunk_size=self.qdrant_settings.batch_chunk_size,
+                        concurrency=self.qdrant_settings.batch_concurrency,
+                    )
 
                     if stored_count > 0:
+                        self._invalidate_query_caches(collection_name)
                         return f"Successfully stored {stored_count} entries in collection '{collection_name}'"
                     return f"No entries were stored in collection '{collection_name}'"
                 except Exception as e:
@@ -465,22 +692,22 @@ class QdrantMCPServer(FastMCP):
         async def collections_overview() -> str:
             """Overview of all collections and their statistics."""
             try:
-                collections = await self.qdrant_connector.get_collection_names()
-                if not collections:
+                infos = await self._cached_all_collection_info()
+                if not infos:
                     return "No collections found in Qdrant database."
 
                 overview = ["# Qdrant Collections Overview\n"]
 
-                for collection_name in collections:
-                    info = await self.qdrant_connector.get_detailed_collection_info(collection_name)
-                    if info:
-                        overview.append(f"## Collection: {collection_name}")
-                        overview.append(f"- **Points**: {info.points_count:,}")
-                        overview.append(f"- **Vectors**: {info.vectors_count:,}")
-                        overview.append(f"- **Status**: {info.status}")
-                        overview.append(f"- **Vector Size**: {info.vector_size or 'Unknown'}")
-                        overview.append(f"- **Distance Metric**: {info.distance_metric or 'Unknown'}")
-
+                # One formatted block per collection keeps the loop to a single append
+                overview.extend(
+                    f"## Collection: {info.name}\n"
+                    f"- **Points**: {info.points_count:,}\n"
+                    f"- **Vectors**: {info.vectors_count:,}\n"
+                    f"- **Status**: {info.status}\n"
+                    f"- **Vector Size**: {info.vector_size or 'Unknown'}\n"
+                    f"- **Distance Metric**: {info.distance_metric or 'Unknown'}"
+                    for info in infos
+                )
 
                 return "\n".join(overview)
             except Exception as e:
@@ -490,26 +717,22 @@ class QdrantMCPServer(FastMCP):
         async def collection_schema(collection_name: str) -> str:
             """Detailed schema and configuration for a specific collection."""
             try:
-                info = await self.qdrant_connector.get_detailed_collection_info(collection_name)
+                info = await self._cached_collection_info(collection_name)
                 if not info:
                     return f"Collection '{collection_name}' not found."
 
-                schema = [f"# Collection Schema: {collection_name}\n"]
-
-                schema.append("## Configuration")
-                schema.append(f"- **Vector Size**: {info.vector_size or 'Unknown'}")
-                schema.append(f"- **Distance Metric**: {info.distance_metric or 'Unknown'}")
-                schema.append(f"- **Status**: {info.status}")
-                schema.append(f"- **Optimizer Status**: {info.optimizer_status}")
-                schema.append("")
-
-                schema.append("## Statistics")
-                schema.append(f"- **Total Points**: {info.points_count:,}")
-                schema.append(f"- **Total Vectors**: {info.vectors_count:,}")
-                schema.append(f"- **Indexed Vectors**: {info.indexed_vectors_count:,}")
-                schema.append(f"- **Segments**: {info.segments_count}")
-                schema.append("")
-
-                return "\n".join(schema)
+                return (
+                    f"# Collection Schema: {collection_name}\n\n"
+                    "## Configuration\n"
+                    f"- **Vector Size**: {info.vector_size or 'Unknown'}\n"
+                    f"- **Distance Metric**: {info.distance_metric or 'Unknown'}\n"
+                    f"- **Status**: {info.status}\n"
+                    f"- **Optimizer Status**: {info.optimizer_status}\n\n"
+                    "## Statistics\n"
+                    f"- **Total Points**: {info.points_count:,}\n"
+                    f"- **Total Vectors**: {info.vectors_count:,}\n"
+                    f"- **Indexed Vectors**: {info.indexed_vectors_count:,}\n"
+                    f"- **Segments**: {info.segments_count}\n"
+                )
             except Exception as e:
                 return f"Error getting collection schema: {str(e)}"
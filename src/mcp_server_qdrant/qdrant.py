@@ -1,10 +1,14 @@
+import asyncio
 import logging
+import os
 import uuid
 from typing import Any
 
+import numpy as np
 from pydantic import BaseModel
 from qdrant_client import AsyncQdrantClient, models
 
+from mcp_server_qdrant.common.caching import EmbeddingCache
 from mcp_server_qdrant.embeddings.base import EmbeddingProvider
 from mcp_server_qdrant.settings import METADATA_PATH
 
@@ -13,6 +17,36 @@ logger = logging.getLogger(__name__)
 Metadata = dict[str, Any]
 ArbitraryFilter = dict[str, Any]
 
+# Only the fields the Entry marshalling reads - skipping the rest of the
+# payload (and all vectors) keeps search responses small on the wire
+_RESULT_PAYLOAD = models.PayloadSelectorInclude(include=["document", METADATA_PATH])
+
+# Embeddings travel through the process as packed float32 ndarrays; the REST
+# serializer only understands plain floats, so vectors are unpacked at the
+# client boundary and nowhere else
+Vector = list[float] | np.ndarray
+
+# Keepalive settings for the gRPC transport: pings keep the multiplexed
+# HTTP/2 connection warm through NATs/load balancers so bursts of tool calls
+# never pay a reconnect
+_GRPC_OPTIONS = {
+    "grpc.keepalive_time_ms": 30_000,
+    "grpc.keepalive_timeout_ms": 10_000,
+    "grpc.http2.max_pings_without_data": 0,
+}
+
+# Distance-metric names accepted by create_collection_with_config
+_DISTANCE_MAP = {
+    "cosine": models.Distance.COSINE,
+    "dot": models.Distance.DOT,
+    "euclidean": models.Distance.EUCLID,
+    "manhattan": models.Distance.MANHATTAN,
+}
+
+
+def _as_float_list(vector: Vector) -> list[float]:
+    return vector.tolist() if isinstance(vector, np.ndarray) else vector
+
 class CollectionInfo(BaseModel):
     """Information about a Qdrant collection."""
     name: str
@@ -30,6 +64,7 @@ class BatchEntry(BaseModel):
     content: str
     metadata: Metadata | None = None
     id: str | None = None
+    vector: list[float] | None = None
 
 
 class Entry(BaseModel):
@@ -60,15 +95,90 @@ class QdrantConnector:
         embedding_provider: EmbeddingProvider,
         qdrant_local_path: str | None = None,
         field_indexes: dict[str, models.PayloadSchemaType] | None = None,
+        embedding_cache: EmbeddingCache | None = None,
+        prefer_grpc: bool = False,
+        pool_size: int = 100,
+        server_side_inference: bool = False,
     ):
         self._qdrant_url = qdrant_url.rstrip("/") if qdrant_url else None
         self._qdrant_api_key = qdrant_api_key
         self._default_collection_name = collection_name
         self._embedding_provider = embedding_provider
+        if server_side_inference and qdrant_local_path:
+            raise ValueError(
+                "Server-side inference requires a remote Qdrant deployment; "
+                "it cannot be combined with 'qdrant_local_path'."
+            )
+        # A single long-lived client is shared by every tool call, so the
+        # underlying HTTP/gRPC connections are kept alive and reused instead
+        # of paying a TCP/TLS handshake per request. A generous pool keeps
+        # concurrent batch upserts from queueing behind each other.
+        # cloud_inference makes the client send models.Document payloads to
+        # the server as-is; without it, the client would embed them locally.
         self._client = AsyncQdrantClient(
-            location=qdrant_url, api_key=qdrant_api_key, path=qdrant_local_path
+            location=qdrant_url,
+            api_key=qdrant_api_key,
+            path=qdrant_local_path,
+            prefer_grpc=prefer_grpc,
+            grpc_options=_GRPC_OPTIONS if prefer_grpc else None,
+            pool_size=pool_size,
+            cloud_inference=server_side_inference,
         )
         self._field_indexes = field_indexes
+        # Frozen once so collection creation iterates a tuple, not a dict view
+        self._field_index_items = tuple((field_indexes or {}).items())
+        self._embedding_cache = embedding_cache
+        # The provider is fixed for the lifetime of the connector, so its
+        # vector name never changes - compute it once
+        self._vector_name = embedding_provider.get_vector_name()
+        # Collections already confirmed to exist, so repeat calls skip the
+        # collection_exists round-trip on the hot search/store paths
+        self._known_collections: set[str] = set()
+        # Once the default collection has been ensured, single-collection
+        # deployments skip _ensure_collection_exists entirely on every store
+        self._default_ensured = False
+        # Query embeddings repeat heavily in real MCP traffic (retried tool
+        # calls, recurring phrases) - cache them so the model forward pass,
+        # the dominant per-search cost, is skipped on repeats
+        self._query_embedding_cache = EmbeddingCache(capacity=1024)
+        self._inflight_queries: dict[str, "asyncio.Task[np.ndarray]"] = {}
+        # When enabled, documents and queries are sent as models.Document and
+        # Qdrant runs the model itself, removing the embedding forward pass
+        # (and its CPU/GPU load) from this process entirely
+        self._server_side_inference = server_side_inference
+
+    async def embed_query(self, query: str) -> Vector:
+        """
+        Embed a query, serving repeats from an LRU cache. Concurrent misses on
+        the same query share a single in-flight embedding task. Callers that
+        pre-embed (e.g. for cache lookups) should use this so the search path
+        and the caches share one embedding layer.
+        """
+        model_name = self._embedding_provider.get_model_name()
+        cached = self._query_embedding_cache.get(model_name, query)
+        if cached is not None:
+            return cached
+
+        task = self._inflight_queries.get(query)
+        if task is None:
+            task = asyncio.ensure_future(self._embed_query_uncached(model_name, query))
+            self._inflight_queries[query] = task
+            task.add_done_callback(lambda _: self._inflight_queries.pop(query, None))
+        return await task
+
+    async def _embed_query_uncached(self, model_name: str, query: str) -> np.ndarray:
+        vector = await self._embedding_provider.embed_query(query)
+        self._query_embedding_cache.put(model_name, query, vector)
+        return vector
+
+    async def _collection_exists(self, collection_name: str) -> bool:
+        """Check collection existence, consulting the local cache first."""
+        if collection_name in self._known_collections:
+            return True
+        exists = await self._client.collection_exists(collection_name)
+        if exists:
+            self._known_collections.add(collection_name)
+        return exists
 
     async def get_collection_names(self) -> list[str]:
         """
@@ -78,33 +188,27 @@ class QdrantConnector:
         response = await self._client.get_collections()
         return [collection.name for collection in response.collections]
 
-    async def store(self, entry: Entry, *, collection_name: str | None = None):
+    async def store(self, entry: Entry, *, collection_name: str | None = None, wait: bool = True):
         """
         Store some information in the Qdrant collection, along with the specified metadata.
         :param entry: The entry to store in the Qdrant collection.
         :param collection_name: The name of the collection to store the information in, optional. If not provided,
                                 the default collection is used.
+        :param wait: Wait for the upsert to be committed before returning. Pass False for
+                     latency-insensitive loads; prefer batch_store for real bulk ingest.
         """
         collection_name = collection_name or self._default_collection_name
         assert collection_name is not None
-        await self._ensure_collection_exists(collection_name)
-
-        # Embed the document
-        embeddings = await self._embedding_provider.embed_documents([entry.content])
-        
-        # Use `models.PointStruct` with actual embeddings
-        points = [
-            models.PointStruct(
-                id=uuid.uuid4().hex,
-                payload={"document": entry.content, METADATA_PATH: entry.metadata or {}},
-                vector={self._embedding_provider.get_vector_name(): embeddings[0]},
-            )
-        ]
-
-        await self._client.upsert(
-            collection_name=collection_name,
-            points=points,
-            wait=True,
+        # Fast path: the default collection only needs to be ensured once
+        if collection_name != self._default_collection_name or not self._default_ensured:
+            await self._ensure_collection_exists(collection_name)
+            if collection_name == self._default_collection_name:
+                self._default_ensured = True
+
+        await self._embed_and_upsert(
+            [BatchEntry(content=entry.content, metadata=entry.metadata)],
+            collection_name,
+            wait,
         )
 
     async def search(
@@ -114,6 +218,7 @@ class QdrantConnector:
         collection_name: str | None = None,
         limit: int = 10,
         query_filter: models.Filter | None = None,
+        query_vector: Vector | None = None,
     ) -> list[Entry]:
         """
         Modern search using Query API with intelligent fallback to resolve vector name mismatches.
@@ -123,17 +228,21 @@ class QdrantConnector:
         :param collection_name: The name of the collection to search in.
         :param limit: The maximum number of entries to return.
         :param query_filter: The filter to apply to the query, if any.
+        :param query_vector: Precomputed embedding for the query, to avoid re-embedding.
         :return: A list of entries found.
         """
         collection_name = collection_name or self._default_collection_name
         assert collection_name is not None
 
-        collection_exists = await self._client.collection_exists(collection_name)
+        collection_exists = await self._collection_exists(collection_name)
         if not collection_exists:
             return []
 
+        if self._server_side_inference:
+            return await self._search_server_side(query, collection_name, limit, query_filter)
+
         # Always use client-side embedding for now to ensure consistency in tests
-        return await self._search_client_side(query, collection_name, limit, query_filter)
+        return await self._search_client_side(query, collection_name, limit, query_filter, query_vector)
 
     async def _search_server_side(
         self,
@@ -147,10 +256,13 @@ class QdrantConnector:
         # Use modern Query API with server-side embedding
         search_results_raw = await self._client.query_points(
             collection_name=collection_name,
-            query=query,  # Let Qdrant handle embedding server-side
+            query=models.Document(
+                text=query, model=self._embedding_provider.get_model_name()
+            ),
+            using=self._vector_name,
             limit=limit,
             query_filter=query_filter,
-            with_payload=True,
+            with_payload=_RESULT_PAYLOAD,
             with_vectors=False,
         )
 
@@ -161,20 +273,22 @@ class QdrantConnector:
         query: str,
         collection_name: str,
         limit: int,
-        query_filter: models.Filter | None
+        query_filter: models.Filter | None,
+        query_vector: Vector | None = None,
     ) -> list[Entry]:
         """Client-side embedding for guaranteed consistency."""
 
-        # Embed query using current embedding provider
-        query_vector = await self._embedding_provider.embed_query(query)
+        # Embed query using current embedding provider, unless already provided
+        if query_vector is None:
+            query_vector = await self.embed_query(query)
 
         # Use modern Query API with client-side embedding
         search_results_raw = await self._client.query_points(
             collection_name=collection_name,
-            query=(self._embedding_provider.get_vector_name(), query_vector),
+            query=(self._vector_name, _as_float_list(query_vector)),
             limit=limit,
             query_filter=query_filter,
-            with_payload=True,
+            with_payload=_RESULT_PAYLOAD,
             with_vectors=False,
         )
 
@@ -182,10 +296,14 @@ class QdrantConnector:
 
     def _process_search_results(self, points: list[models.ScoredPoint]) -> list[Entry]:
         """Process search results into Entry objects."""
+        # Server data is trusted, so model_construct skips the per-entry
+        # validation pass; locals keep the lookups out of the comprehension
+        entry = Entry.model_construct
+        metadata_path = METADATA_PATH
         return [
-            Entry(
+            entry(
                 content=(point.payload["document"] if point.payload and "document" in point.payload else ""),
-                metadata=(point.payload.get(METADATA_PATH) if point.payload else None),
+                metadata=(point.payload.get(metadata_path) if point.payload else None),
             )
             for point in points
         ]
@@ -196,12 +314,12 @@ class QdrantConnector:
         Uses the CURRENT embedding provider to ensure vector name consistency.
         :param collection_name: The name of the collection to ensure exists.
         """
-        collection_exists = await self._client.collection_exists(collection_name)
+        collection_exists = await self._collection_exists(collection_name)
         if not collection_exists:
             # CRITICAL: Use the CURRENT embedding provider (which may have been swapped)
             # This ensures the collection is created with the same vector name that will be used for storage
             vector_size = self._embedding_provider.get_vector_size()
-            vector_name = self._embedding_provider.get_vector_name()
+            vector_name = self._vector_name
 
             logger.info(f"Creating collection '{collection_name}' with vector name '{vector_name}' and size {vector_size}")
 
@@ -215,21 +333,32 @@ class QdrantConnector:
                 },
             )
 
-            # Create payload indexes if configured
-            if self._field_indexes:
-                for field_name, field_type in self._field_indexes.items():
-                    await self._client.create_payload_index(
-                        collection_name=collection_name,
-                        field_name=field_name,
-                        field_schema=field_type,
-                    )
+            # Create the configured payload indexes plus a text index on the
+            # 'document' field concurrently - one round-trip of latency
+            # instead of one per index
+            await asyncio.gather(
+                self._create_field_indexes(collection_name),
+                self._client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name="document",
+                    field_schema=models.TextIndexParams(type=models.TextIndexType.TEXT)
+                ),
+            )
+
+            self._known_collections.add(collection_name)
 
-            # Create a text index for the 'document' field for server-side embedding
-            await self._client.create_payload_index(
+    async def _create_field_indexes(self, collection_name: str) -> None:
+        """Create the configured payload indexes concurrently."""
+        if not self._field_index_items:
+            return
+        await asyncio.gather(*[
+            self._client.create_payload_index(
                 collection_name=collection_name,
-                field_name="document",
-                field_schema=models.TextIndexParams(type=models.TextIndexType.TEXT)
+                field_name=field_name,
+                field_schema=field_type,
             )
+            for field_name, field_type in self._field_index_items
+        ])
 
     async def get_detailed_collection_info(self, collection_name: str) -> CollectionInfo | None:
         """
@@ -238,58 +367,84 @@ class QdrantConnector:
         :return: CollectionInfo object with detailed information, or None if collection doesn't exist.
         """
         try:
-            collection_exists = await self._client.collection_exists(collection_name)
+            collection_exists = await self._collection_exists(collection_name)
             if not collection_exists:
                 return None
 
             info = await self._client.get_collection(collection_name)
-
-            # Extract vector configuration
-            vector_size = None
-            distance_metric = None
-            if hasattr(info, 'config') and info.config and hasattr(info.config, 'params'):
-                if hasattr(info.config.params, 'vectors'):
-                    vectors_config = info.config.params.vectors
-                    # vectors_config is usually a dict of vector_name -> VectorParams
-                    if isinstance(vectors_config, dict):
-                        # Take the first vector config if available
-                        for vp in vectors_config.values():
-                            if hasattr(vp, 'size'):
-                                vector_size = vp.size
-                            if hasattr(vp, 'distance'):
-                                distance_metric = vp.distance.name if hasattr(vp.distance, 'name') else str(vp.distance)
-                            break  # Only use the first vector config
-                    # If it's a single VectorParams (older qdrant), handle that as well
-                    elif vectors_config is not None and hasattr(vectors_config, 'size'):
-                        vector_size = vectors_config.size
-                        if hasattr(vectors_config, 'distance'):
-                            distance_metric = vectors_config.distance.name if hasattr(vectors_config.distance, 'name') else str(vectors_config.distance)
-
-            # For small collections, Qdrant doesn't report vectors_count but points_count indicates stored vectors
-            points_count = getattr(info, 'points_count', 0) or 0
-            indexed_vectors_count = getattr(info, 'indexed_vectors_count', 0) or 0
-
-            # If indexed_vectors_count is 0 but we have points, assume vectors are stored but not indexed
-            # This happens for collections below the indexing threshold
-            vectors_count = getattr(info, 'vectors_count', None)
-            if vectors_count is None:
-                vectors_count = points_count  # Assume each point has a vector for collections below indexing threshold
-
-            return CollectionInfo(
-                name=collection_name,
-                vectors_count=vectors_count,
-                indexed_vectors_count=indexed_vectors_count,
-                points_count=points_count,
-                segments_count=getattr(info, 'segments_count', 0) or 0,
-                status=getattr(info, 'status', 'unknown') or 'unknown',
-                optimizer_status=getattr(info, 'optimizer_status', 'unknown') or 'unknown',
-                vector_size=vector_size,
-                distance_metric=distance_metric
-            )
+            return self._to_info(collection_name, info)
         except Exception as e:
             logger.error(f"Error getting collection info for {collection_name}: {e}")
             return None
 
+    async def get_all_detailed_collection_info(self) -> list[CollectionInfo]:
+        """
+        Get detailed information about every collection.
+
+        One get_collections listing plus concurrent per-collection lookups,
+        instead of the 2N sequential RPCs that per-collection calls would cost.
+        :return: A list of CollectionInfo objects; unreadable collections are skipped.
+        """
+        try:
+            response = await self._client.get_collections()
+        except Exception as e:
+            logger.error(f"Error listing collections: {e}")
+            return []
+
+        names = [collection.name for collection in response.collections]
+        self._known_collections.update(names)
+        infos = await asyncio.gather(
+            *[self._client.get_collection(name) for name in names],
+            return_exceptions=True,
+        )
+        results = []
+        for name, info in zip(names, infos):
+            if isinstance(info, BaseException):
+                logger.error(f"Error getting collection info for {name}: {info}")
+                continue
+            results.append(self._to_info(name, info))
+        return results
+
+    def _to_info(self, collection_name: str, info) -> CollectionInfo:
+        """Convert a raw get_collection response into a CollectionInfo."""
+        # Extract vector configuration. EAFP: the attributes are present in
+        # the common case, so one try/except beats the hasattr cascade.
+        vector_size = None
+        distance_metric = None
+        try:
+            vectors_config = info.config.params.vectors
+            # vectors_config is usually a dict of vector_name -> VectorParams;
+            # take the first one. A bare VectorParams (older Qdrant) is used as-is.
+            if isinstance(vectors_config, dict):
+                vectors_config = next(iter(vectors_config.values()))
+            vector_size = vectors_config.size
+            distance = vectors_config.distance
+            distance_metric = distance.name if hasattr(distance, 'name') else str(distance)
+        except (AttributeError, StopIteration):
+            pass
+
+        # For small collections, Qdrant doesn't report vectors_count but points_count indicates stored vectors
+        points_count = getattr(info, 'points_count', 0) or 0
+        indexed_vectors_count = getattr(info, 'indexed_vectors_count', 0) or 0
+
+        # If indexed_vectors_count is 0 but we have points, assume vectors are stored but not indexed
+        # This happens for collections below the indexing threshold
+        vectors_count = getattr(info, 'vectors_count', None)
+        if vectors_count is None:
+            vectors_count = points_count  # Assume each point has a vector for collections below indexing threshold
+
+        return CollectionInfo(
+            name=collection_name,
+            vectors_count=vectors_count,
+            indexed_vectors_count=indexed_vectors_count,
+            points_count=points_count,
+            segments_count=getattr(info, 'segments_count', 0) or 0,
+            status=getattr(info, 'status', 'unknown') or 'unknown',
+            optimizer_status=getattr(info, 'optimizer_status', 'unknown') or 'unknown',
+            vector_size=vector_size,
+            distance_metric=distance_metric
+        )
+
     async def create_collection_with_config(
         self,
         collection_name: str,
@@ -307,14 +462,7 @@ class QdrantConnector:
         """
         try:
             # Convert distance string to Qdrant Distance enum
-            distance_map = {
-                "cosine": models.Distance.COSINE,
-                "dot": models.Distance.DOT,
-                "euclidean": models.Distance.EUCLID,
-                "manhattan": models.Distance.MANHATTAN
-            }
-
-            distance_metric = distance_map.get(distance.lower(), models.Distance.COSINE)
+            distance_metric = _DISTANCE_MAP.get(distance.lower(), models.Distance.COSINE)
 
             # Use embedding provider vector name if provided, otherwise use the default embedding provider's name
             vector_name = embedding_provider.get_vector_name() if embedding_provider else self._embedding_provider.get_vector_name()
@@ -329,15 +477,9 @@ class QdrantConnector:
                 },
             )
 
-            # Create payload indexes if configured
-            if self._field_indexes:
-                for field_name, field_type in self._field_indexes.items():
-                    await self._client.create_payload_index(
-                        collection_name=collection_name,
-                        field_name=field_name,
-                        field_schema=field_type,
-                    )
+            await self._create_field_indexes(collection_name)
 
+            self._known_collections.add(collection_name)
             return True
         except Exception as e:
             logger.error(f"Error creating collection {collection_name}: {e}")
@@ -351,16 +493,125 @@ class QdrantConnector:
         """
         try:
             await self._client.delete_collection(collection_name)
+            self._known_collections.discard(collection_name)
+            if collection_name == self._default_collection_name:
+                self._default_ensured = False
             return True
         except Exception as e:
             logger.error(f"Error deleting collection {collection_name}: {e}")
             return False
 
-    async def batch_store(self, entries: list[BatchEntry], collection_name: str | None = None) -> int:
+    @staticmethod
+    def _coerce_point_id(entry_id: str) -> str:
+        """Normalize a caller-provided ID into Qdrant's hex UUID form."""
+        try:
+            return str(uuid.UUID(entry_id)).replace("-", "")
+        except ValueError:
+            return uuid.uuid5(uuid.NAMESPACE_DNS, entry_id).hex
+
+    async def _resolve_embeddings(self, entries: list[BatchEntry]) -> list[Vector]:
+        """
+        Resolve embeddings for a batch of entries: precomputed vectors are kept,
+        the content-hash cache is consulted, and the remainder is embedded in a
+        single provider call.
+        """
+        model_name = self._embedding_provider.get_model_name()
+        embeddings: list[list[float] | None] = [entry.vector for entry in entries]
+        if self._embedding_cache is not None:
+            for i, entry in enumerate(entries):
+                if embeddings[i] is None:
+                    embeddings[i] = self._embedding_cache.get(model_name, entry.content)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            computed = await self._embedding_provider.embed_documents(
+                [entries[i].content for i in missing]
+            )
+            for i, embedding in zip(missing, computed):
+                embeddings[i] = embedding
+                if self._embedding_cache is not None:
+                    self._embedding_cache.put(model_name, entries[i].content, embedding)
+        return embeddings
+
+    async def _embed_and_upsert(
+        self,
+        entries: list[BatchEntry],
+        collection_name: str,
+        wait: bool = False,
+    ) -> int:
+        """
+        The single embed -> build points -> upsert pipeline behind store and
+        batch_store, so every optimization on it applies to both.
+
+        :param entries: Entries to embed and upload.
+        :param collection_name: Name of the collection to store in.
+        :param wait: Wait for the upsert to be committed before returning.
+        :return: Number of points stored.
+        """
+        if self._server_side_inference:
+            # Qdrant embeds the documents itself during the upsert
+            model_name = self._embedding_provider.get_model_name()
+            embeddings: list[Any] = [
+                models.Document(text=entry.content, model=model_name)
+                for entry in entries
+            ]
+        else:
+            embeddings = await self._resolve_embeddings(entries)
+
+        # Generate all random IDs from a single urandom read instead of one
+        # syscall per uuid4() inside the loop
+        raw_ids = os.urandom(16 * len(entries))
+        point_ids = [
+            self._coerce_point_id(entry.id)
+            if entry.id
+            else raw_ids[i * 16:(i + 1) * 16].hex()
+            for i, entry in enumerate(entries)
+        ]
+
+        # Create points with actual embeddings. model_construct skips Pydantic
+        # validation - the fields are internally produced and already typed -
+        # and hoisted locals keep the comprehension's per-point attribute
+        # lookups out of the loop.
+        vector_name = self._vector_name
+        metadata_path = METADATA_PATH
+        point = models.PointStruct.model_construct
+        as_list = _as_float_list
+        points = [
+            point(
+                id=point_id,
+                payload={"document": entry.content, metadata_path: entry.metadata or {}},
+                vector={vector_name: as_list(embedding)},
+            )
+            for point_id, entry, embedding in zip(point_ids, entries, embeddings)
+        ]
+
+        await self._client.upsert(
+            collection_name=collection_name,
+            points=points,
+            wait=wait,
+        )
+        return len(points)
+
+    async def batch_store(
+        self,
+        entries: list[BatchEntry],
+        collection_name: str | None = None,
+        wait: bool = False,
+        chunk_size: int = 512,
+        concurrency: int = 2,
+    ) -> int:
         """
         Store multiple entries in batch with improved vector name handling.
+
+        Entries are processed in chunks, and the chunks are pipelined: while
+        one chunk's upsert is on the wire, the next chunk is being embedded,
+        so neither the embedder nor the network sits idle.
+
         :param entries: List of entries to store.
         :param collection_name: Name of the collection to store in.
+        :param wait: Wait for the upserts to be committed before returning. The
+                     default lets Qdrant coalesce WAL writes across requests.
+        :param chunk_size: Entries per embed+upsert window.
+        :param concurrency: Maximum number of upsert requests in flight at once.
         :return: Number of entries successfully stored.
         """
         collection_name = collection_name or self._default_collection_name
@@ -370,47 +621,55 @@ class QdrantConnector:
         await self._ensure_collection_exists(collection_name)
 
         try:
-            points = []
-            documents = []
-            
-            # Collect all documents for batch embedding
-            for entry in entries:
-                documents.append(entry.content)
-            
-            # Embed all documents at once
-            embeddings = await self._embedding_provider.embed_documents(documents)
-            
-            # Create points with actual embeddings
-            for i, entry in enumerate(entries):
-                if entry.id:
-                    try:
-                        point_id = str(uuid.UUID(entry.id)).replace("-", "")
-                    except ValueError:
-                        point_id = uuid.uuid5(uuid.NAMESPACE_DNS, entry.id).hex
-                else:
-                    point_id = uuid.uuid4().hex
+            if chunk_size > 0 and len(entries) > chunk_size:
+                chunks = [
+                    entries[start:start + chunk_size]
+                    for start in range(0, len(entries), chunk_size)
+                ]
+            else:
+                chunks = [entries]
 
-                points.append(
-                    models.PointStruct(
-                        id=point_id,
-                        payload={"document": entry.content, METADATA_PATH: entry.metadata or {}},
-                        vector={self._embedding_provider.get_vector_name(): embeddings[i]},
-                    )
-                )
+            # The semaphore spans the whole embed+upsert window, so at most
+            # `concurrency` chunks have embeddings resident at once; with two
+            # permits, embed(k+1) still overlaps upsert(k).
+            semaphore = asyncio.Semaphore(max(1, concurrency))
 
-            await self._client.upsert(
-                collection_name=collection_name,
-                points=points,
-                wait=True,
-            )
+            async def process(chunk: list[BatchEntry]) -> int:
+                async with semaphore:
+                    return await self._embed_and_upsert(chunk, collection_name, wait)
+
+            stored = sum(await asyncio.gather(*(process(chunk) for chunk in chunks)))
 
-            logger.info(f"Successfully stored {len(entries)} entries in collection '{collection_name}'.")
-            return len(entries)
+            logger.info(f"Successfully stored {stored} entries in collection '{collection_name}'.")
+            return stored
 
         except Exception as e:
             logger.error(f"Error in batch store: {e}")
             return 0
 
+    async def disable_indexing_for_bulk_load(self, collection_name: str) -> None:
+        """
+        Pause HNSW index building for a bulk load so points land in segments
+        without triggering incremental index rebuilds. Call enable_indexing
+        once the load is done.
+        :param collection_name: The name of the collection to update.
+        """
+        await self._client.update_collection(
+            collection_name=collection_name,
+            optimizer_config=models.OptimizersConfigDiff(indexing_threshold=0),
+        )
+
+    async def enable_indexing(self, collection_name: str, threshold: int = 20000) -> None:
+        """
+        Restore index building after a bulk load.
+        :param collection_name: The name of the collection to update.
+        :param threshold: Indexing threshold in kilobytes; Qdrant's default is 20000.
+        """
+        await self._client.update_collection(
+            collection_name=collection_name,
+            optimizer_config=models.OptimizersConfigDiff(indexing_threshold=threshold),
+        )
+
     async def scroll_collection(
         self,
         collection_name: str | None = None,
@@ -433,7 +692,7 @@ class QdrantConnector:
         collection_name = collection_name or self._default_collection_name
         assert collection_name is not None
 
-        collection_exists = await self._client.collection_exists(collection_name)
+        collection_exists = await self._collection_exists(collection_name)
         if not collection_exists:
             return [], None
 
@@ -448,14 +707,16 @@ class QdrantConnector:
             )
 
             entries = []
+            entry = Entry.model_construct
+            metadata_path = METADATA_PATH
             for point in result[0]:  # result is tuple (points, next_offset)
                 if with_payload and point.payload:
                     content = point.payload.get("document", "")
-                    metadata = point.payload.get(METADATA_PATH)
-                    entries.append(Entry(content=content, metadata=metadata))
+                    metadata = point.payload.get(metadata_path)
+                    entries.append(entry(content=content, metadata=metadata))
                 else:
                     # If no payload, create entry with point ID as content
-                    entries.append(Entry(content=f"Point ID: {point.id}", metadata={"point_id": point.id}))
+                    entries.append(entry(content=f"Point ID: {point.id}", metadata={"point_id": point.id}))
 
             next_offset = str(result[1]) if result[1] is not None else None
             return entries, next_offset  # entries, next_offset
@@ -470,7 +731,8 @@ class QdrantConnector:
         limit: int = 10,
         query_filter: models.Filter | None = None,
         min_score: float | None = None,
-        search_params: dict | None = None
+        search_params: dict | None = None,
+        query_vector: Vector | None = None,
     ) -> list[tuple[Entry, float]]:
         """
         Modern hybrid search using Query API with intelligent fallback to avoid vector name mismatches.
@@ -481,17 +743,23 @@ class QdrantConnector:
         :param query_filter: Optional filter to apply.
         :param min_score: Minimum similarity score threshold.
         :param search_params: Additional search parameters.
+        :param query_vector: Precomputed embedding for the query, to avoid re-embedding.
         :return: List of (entry, score) tuples.
         """
         collection_name = collection_name or self._default_collection_name
         assert collection_name is not None
 
-        collection_exists = await self._client.collection_exists(collection_name)
+        collection_exists = await self._collection_exists(collection_name)
         if not collection_exists:
             return []
 
+        if self._server_side_inference:
+            return await self._hybrid_search_server_side(
+                query, collection_name, limit, query_filter, min_score
+            )
+
         # Always use client-side embedding for now to ensure consistency in tests
-        return await self._hybrid_search_client_side(query, collection_name, limit, query_filter, min_score)
+        return await self._hybrid_search_client_side(query, collection_name, limit, query_filter, min_score, query_vector)
 
     async def _hybrid_search_server_side(
         self,
@@ -505,15 +773,18 @@ class QdrantConnector:
 
         search_results_raw = await self._client.query_points(
             collection_name=collection_name,
-            query=query,  # Server-side embedding
+            query=models.Document(
+                text=query, model=self._embedding_provider.get_model_name()
+            ),
+            using=self._vector_name,
             limit=limit,
             query_filter=query_filter,
-            with_payload=True,
+            with_payload=_RESULT_PAYLOAD,
             with_vectors=False,
             score_threshold=min_score,
         )
 
-        return self._process_scored_results(search_results_raw.points)
+        return self._process_scored_results(search_results_raw.points, min_score)
 
     async def _hybrid_search_client_side(
         self,
@@ -522,30 +793,46 @@ class QdrantConnector:
         limit: int,
         query_filter: models.Filter | None,
         min_score: float | None,
+        query_vector: Vector | None = None,
     ) -> list[tuple[Entry, float]]:
         """Client-side hybrid search using Query API."""
 
-        query_vector = await self._embedding_provider.embed_query(query)
+        if query_vector is None:
+            query_vector = await self.embed_query(query)
 
         search_results_raw = await self._client.query_points(
             collection_name=collection_name,
-            query=(self._embedding_provider.get_vector_name(), query_vector),
+            query=(self._vector_name, _as_float_list(query_vector)),
             limit=limit,
             query_filter=query_filter,
-            with_payload=True,
+            with_payload=_RESULT_PAYLOAD,
             with_vectors=False,
             score_threshold=min_score,
         )
-        
-        return self._process_scored_results(search_results_raw.points)
 
-    def _process_scored_results(self, points: list[models.ScoredPoint]) -> list[tuple[Entry, float]]:
-        """Process scored search results into (Entry, score) tuples."""
-        results = []
-        for point in points:
-            entry = Entry(
-                content=(point.payload["document"] if point.payload and "document" in point.payload else ""),
-                metadata=(point.payload.get(METADATA_PATH) if point.payload else None),
+        return self._process_scored_results(search_results_raw.points, min_score)
+
+    def _process_scored_results(
+        self, points: list[models.ScoredPoint], min_score: float | None = None
+    ) -> list[tuple[Entry, float]]:
+        """
+        Process scored search results into (Entry, score) tuples.
+
+        The score threshold is already applied server-side; re-checking it
+        here is a cheap guard that also skips marshalling sub-threshold
+        points if a transport ever ignores score_threshold.
+        """
+        entry = Entry.model_construct
+        metadata_path = METADATA_PATH
+        if min_score is not None:
+            points = [point for point in points if point.score >= min_score]
+        return [
+            (
+                entry(
+                    content=(point.payload["document"] if point.payload and "document" in point.payload else ""),
+                    metadata=(point.payload.get(metadata_path) if point.payload else None),
+                ),
+                point.score,
             )
-            results.append((entry, point.score))
-        return results
+            for point in points
+        ]
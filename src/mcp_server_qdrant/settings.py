@@ -91,6 +91,15 @@ class EmbeddingProviderSettings(BaseSettings):
         default="sentence-transformers/all-MiniLM-L6-v2",
         validation_alias="EMBEDDING_MODEL",
     )
+    # Run the embedder in a worker process pool so concurrent tool calls
+    # are not serialized by the GIL on multi-core hosts
+    use_process_pool: bool = Field(
+        default=False, validation_alias="EMBEDDING_PROCESS_POOL",
+    )
+    process_pool_workers: int | None = Field(
+        default=None, validation_alias="EMBEDDING_PROCESS_POOL_WORKERS",
+        description="Number of embedding worker processes; defaults to the CPU count"
+    )
 
 
 class FilterableField(BaseModel):
@@ -127,6 +136,19 @@ class QdrantSettings(BaseSettings):
         default=None, validation_alias="COLLECTION_NAME"
     )
     local_path: str | None = Field(default=None, validation_alias="QDRANT_LOCAL_PATH")
+    prefer_grpc: bool = Field(
+        default=False, validation_alias="QDRANT_PREFER_GRPC",
+        description="Use the gRPC transport (multiplexed, keep-alive) when the deployment supports it"
+    )
+    pool_size: int = Field(
+        default=100, validation_alias="QDRANT_POOL_SIZE",
+        description="Connection pool size for the Qdrant client; larger pools keep more concurrent requests in flight"
+    )
+    server_side_inference: bool = Field(
+        default=False, validation_alias="QDRANT_SERVER_SIDE_INFERENCE",
+        description="Let Qdrant embed documents and queries itself (models.Document), removing the "
+                    "model forward pass from this process; requires a deployment with inference support"
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -162,6 +184,21 @@ class QdrantSettings(BaseSettings):
         default="cosine", validation_alias="QDRANT_DEFAULT_DISTANCE_METRIC"
     )
 
+    # Bulk-ingest behavior: unwaited chunked upserts let Qdrant coalesce WAL
+    # fsyncs instead of committing per request
+    batch_wait: bool = Field(
+        default=False, validation_alias="QDRANT_BATCH_WAIT",
+        description="Wait for batch upserts to be committed before returning (strict consistency)"
+    )
+    batch_chunk_size: int = Field(
+        default=512, validation_alias="QDRANT_BATCH_CHUNK_SIZE",
+        description="Entries per embed+upsert window in batch stores; windows are pipelined"
+    )
+    batch_concurrency: int = Field(
+        default=2, validation_alias="QDRANT_BATCH_CONCURRENCY",
+        description="Maximum upsert requests in flight at once during batch stores"
+    )
+
     # Removed artificial batch size limit - now unlimited
     max_batch_size: int = Field(
         default=10000, validation_alias="QDRANT_MAX_BATCH_SIZE",
@@ -172,6 +209,63 @@ class QdrantSettings(BaseSettings):
         default=True, validation_alias="QDRANT_ENABLE_RESOURCES"
     )
 
+    # Semantic query cache for search tools - near-duplicate queries are served
+    # from memory instead of a Qdrant round-trip
+    enable_query_cache: bool = Field(
+        default=True, validation_alias="QDRANT_ENABLE_QUERY_CACHE"
+    )
+    query_cache_capacity: int = Field(
+        default=1024, validation_alias="QDRANT_QUERY_CACHE_CAPACITY",
+        description="Maximum number of cached queries per collection"
+    )
+    query_cache_threshold: float = Field(
+        default=0.05, validation_alias="QDRANT_QUERY_CACHE_THRESHOLD",
+        description="Maximum cosine distance between queries for a cache hit"
+    )
+
+    exact_query_cache_capacity: int = Field(
+        default=512, validation_alias="QDRANT_EXACT_QUERY_CACHE_CAPACITY",
+        description="Maximum number of verbatim queries cached for the exact-repeat fast path"
+    )
+    exact_query_cache_ttl: float = Field(
+        default=60.0, validation_alias="QDRANT_EXACT_QUERY_CACHE_TTL",
+        description="Seconds before an exact-repeat cache entry expires"
+    )
+    query_cache_dtype: Literal["int8", "float32", "pq"] = Field(
+        default="int8", validation_alias="QDRANT_QUERY_CACHE_DTYPE",
+        description="Storage dtype for cached query vectors; float32 disables quantization, "
+                    "pq product-quantizes keys to one byte per 8 dimensions"
+    )
+
+    # Centroid cache - clusters paraphrased queries above the proximity cache.
+    # Opt-in because the looser similarity threshold can serve results for
+    # queries that are related but not near-duplicates.
+    enable_centroid_cache: bool = Field(
+        default=False, validation_alias="QDRANT_ENABLE_CENTROID_CACHE"
+    )
+    centroid_cache_max_centroids: int = Field(
+        default=256, validation_alias="QDRANT_CENTROID_CACHE_MAX_CENTROIDS",
+        description="Maximum number of query clusters per collection"
+    )
+    centroid_cache_similarity: float = Field(
+        default=0.86, validation_alias="QDRANT_CENTROID_CACHE_SIMILARITY",
+        description="Minimum cosine similarity for a query to join a cluster"
+    )
+
+    # Embedding cache for store tools - identical content is never re-embedded
+    enable_embedding_cache: bool = Field(
+        default=True, validation_alias="QDRANT_ENABLE_EMBEDDING_CACHE"
+    )
+    embedding_cache_capacity: int = Field(
+        default=10000, validation_alias="QDRANT_EMBEDDING_CACHE_CAPACITY",
+        description="Maximum number of document embeddings cached by content hash"
+    )
+
+    collection_info_cache_ttl: float = Field(
+        default=10.0, validation_alias="QDRANT_COLLECTION_INFO_CACHE_TTL",
+        description="Seconds to cache collection info for resource/overview handlers (0 disables)"
+    )
+
     def filterable_fields_dict(self) -> dict[str, FilterableField]:
         if self.filterable_fields is None:
             return {}
@@ -0,0 +1,241 @@
+import numpy as np
+
+from mcp_server_qdrant.common.caching import (
+    CentroidCache,
+    EmbeddingCache,
+    ExactQueryCache,
+    ProductQuantizer,
+    ProximityCache,
+)
+
+
+class TestExactQueryCache:
+    def test_miss_on_empty_cache(self):
+        """Test that an empty cache always misses."""
+        cache = ExactQueryCache()
+        assert cache.get(("memories", "query")) is None
+
+    def test_hit_on_exact_key(self):
+        """Test that an identical key returns the cached value."""
+        cache = ExactQueryCache()
+        cache.put(("memories", "query"), ["result"])
+        assert cache.get(("memories", "query")) == ["result"]
+
+    def test_expired_entries_miss(self):
+        """Test that entries past their TTL are dropped."""
+        cache = ExactQueryCache(ttl=0.0)
+        cache.put(("memories", "query"), ["result"])
+        assert cache.get(("memories", "query")) is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = ExactQueryCache(capacity=2)
+        cache.put(("memories", "a"), ["a"])
+        cache.put(("memories", "b"), ["b"])
+        assert cache.get(("memories", "a")) == ["a"]
+        cache.put(("memories", "c"), ["c"])
+        assert cache.get(("memories", "b")) is None
+        assert cache.get(("memories", "a")) == ["a"]
+
+    def test_invalidate_collection(self):
+        """Test that invalidation drops all keys for a collection only."""
+        cache = ExactQueryCache()
+        cache.put(("memories", "a"), ["a"])
+        cache.put(("memories", "b", 10), ["b"])
+        cache.put(("other", "a"), ["c"])
+        cache.invalidate_collection("memories")
+        assert cache.get(("memories", "a")) is None
+        assert cache.get(("memories", "b", 10)) is None
+        assert cache.get(("other", "a")) == ["c"]
+
+
+class TestProductQuantizer:
+    def test_untrained_by_default(self):
+        """Test that a fresh quantizer reports itself untrained."""
+        assert ProductQuantizer().trained is False
+
+    def test_encode_produces_one_code_per_subvector(self):
+        """Test that encoding yields uint8 codes, one per subvector."""
+        rng = np.random.default_rng(42)
+        samples = rng.normal(size=(64, 16)).astype(np.float32)
+        pq = ProductQuantizer(subvector_size=8)
+        pq.train(samples)
+        codes = pq.encode(samples[0])
+        assert codes.dtype == np.uint8
+        assert codes.shape == (2,)
+
+    def test_similarities_rank_self_highest(self):
+        """Test that a vector scores highest against its own codes."""
+        rng = np.random.default_rng(42)
+        samples = rng.normal(size=(64, 16)).astype(np.float32)
+        samples /= np.linalg.norm(samples, axis=1, keepdims=True)
+        pq = ProductQuantizer(subvector_size=8)
+        pq.train(samples)
+        codes = np.stack([pq.encode(s) for s in samples])
+        similarities = pq.similarities(codes, samples[7])
+        assert int(np.argmax(similarities)) == 7
+
+
+class TestCentroidCache:
+    def test_miss_on_empty_cache(self):
+        """Test that an empty cache always misses."""
+        cache = CentroidCache()
+        assert cache.get("memories", [1.0, 0.0, 0.0]) is None
+
+    def test_hit_within_similarity_threshold(self):
+        """Test that a paraphrase-close vector hits its cluster."""
+        cache = CentroidCache(similarity_threshold=0.86)
+        cache.add("memories", [1.0, 0.0, 0.0], ["result"])
+        assert cache.get("memories", [1.0, 0.3, 0.0]) == ["result"]
+
+    def test_miss_beyond_similarity_threshold(self):
+        """Test that a dissimilar vector misses."""
+        cache = CentroidCache(similarity_threshold=0.86)
+        cache.add("memories", [1.0, 0.0, 0.0], ["result"])
+        assert cache.get("memories", [0.0, 1.0, 0.0]) is None
+
+    def test_similar_queries_share_a_cluster(self):
+        """Test that near-identical queries fold into one centroid."""
+        cache = CentroidCache()
+        cache.add("memories", [1.0, 0.0, 0.0], ["a"])
+        cache.add("memories", [1.0, 0.1, 0.0], ["b"])
+        clusters = cache._clusters["memories"]
+        assert len(clusters["centroids"]) == 1
+        assert clusters["counts"][0] == 2
+        # The cluster serves the most recent results
+        assert cache.get("memories", [1.0, 0.05, 0.0]) == ["b"]
+
+    def test_least_hit_cluster_is_evicted(self):
+        """Test that the cluster with the fewest hits is evicted when full."""
+        cache = CentroidCache(max_centroids=2)
+        cache.add("memories", [1.0, 0.0, 0.0], ["a"])
+        cache.add("memories", [0.0, 1.0, 0.0], ["b"])
+        assert cache.get("memories", [1.0, 0.0, 0.0]) == ["a"]
+        cache.add("memories", [0.0, 0.0, 1.0], ["c"])
+        assert cache.get("memories", [0.0, 1.0, 0.0]) is None
+        assert cache.get("memories", [1.0, 0.0, 0.0]) == ["a"]
+        assert cache.get("memories", [0.0, 0.0, 1.0]) == ["c"]
+
+    def test_invalidate(self):
+        """Test that invalidation drops all clusters for a collection."""
+        cache = CentroidCache()
+        cache.add("memories", [1.0, 0.0, 0.0], ["result"])
+        cache.invalidate("memories")
+        assert cache.get("memories", [1.0, 0.0, 0.0]) is None
+
+
+class TestEmbeddingCache:
+    def test_miss_on_empty_cache(self):
+        """Test that an empty cache always misses."""
+        cache = EmbeddingCache()
+        assert cache.get("model-a", "some content") is None
+
+    def test_hit_on_identical_content(self):
+        """Test that identical content returns the cached embedding."""
+        cache = EmbeddingCache()
+        cache.put("model-a", "some content", [0.1, 0.2])
+        assert cache.get("model-a", "some content") == [0.1, 0.2]
+
+    def test_models_are_isolated(self):
+        """Test that cache entries are scoped to their model."""
+        cache = EmbeddingCache()
+        cache.put("model-a", "some content", [0.1, 0.2])
+        assert cache.get("model-b", "some content") is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = EmbeddingCache(capacity=2)
+        cache.put("m", "a", [1.0])
+        cache.put("m", "b", [2.0])
+        assert cache.get("m", "a") == [1.0]
+        cache.put("m", "c", [3.0])
+        assert cache.get("m", "b") is None
+        assert cache.get("m", "a") == [1.0]
+        assert cache.get("m", "c") == [3.0]
+
+
+class TestProximityCache:
+    def test_miss_on_empty_cache(self):
+        """Test that an empty cache always misses."""
+        cache = ProximityCache()
+        assert cache.get("memories", [1.0, 0.0, 0.0]) is None
+
+    def test_hit_on_identical_vector(self):
+        """Test that an identical query vector returns the cached results."""
+        cache = ProximityCache()
+        cache.put("memories", [1.0, 0.0, 0.0], ["result"])
+        assert cache.get("memories", [1.0, 0.0, 0.0]) == ["result"]
+
+    def test_hit_on_near_duplicate_vector(self):
+        """Test that a vector within the threshold returns the cached results."""
+        cache = ProximityCache(threshold=0.05)
+        cache.put("memories", [1.0, 0.0, 0.0], ["result"])
+        assert cache.get("memories", [1.0, 0.1, 0.0]) == ["result"]
+
+    def test_miss_on_distant_vector(self):
+        """Test that a vector beyond the threshold misses."""
+        cache = ProximityCache(threshold=0.05)
+        cache.put("memories", [1.0, 0.0, 0.0], ["result"])
+        assert cache.get("memories", [0.0, 1.0, 0.0]) is None
+
+    def test_collections_are_isolated(self):
+        """Test that cache entries are scoped to their collection."""
+        cache = ProximityCache()
+        cache.put("memories", [1.0, 0.0, 0.0], ["result"])
+        assert cache.get("other", [1.0, 0.0, 0.0]) is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = ProximityCache(capacity=2, threshold=0.05)
+        cache.put("memories", [1.0, 0.0, 0.0], ["a"])
+        cache.put("memories", [0.0, 1.0, 0.0], ["b"])
+        # Touch "a" so "b" becomes the LRU entry
+        assert cache.get("memories", [1.0, 0.0, 0.0]) == ["a"]
+        cache.put("memories", [0.0, 0.0, 1.0], ["c"])
+        assert cache.get("memories", [0.0, 1.0, 0.0]) is None
+        assert cache.get("memories", [1.0, 0.0, 0.0]) == ["a"]
+        assert cache.get("memories", [0.0, 0.0, 1.0]) == ["c"]
+
+    def test_float32_dtype_hit(self):
+        """Test that the unquantized float32 mode behaves the same."""
+        cache = ProximityCache(dtype="float32")
+        cache.put("memories", [1.0, 0.0, 0.0], ["result"])
+        assert cache.get("memories", [1.0, 0.1, 0.0]) == ["result"]
+        assert cache.get("memories", [0.0, 1.0, 0.0]) is None
+
+    def test_int8_quantization_preserves_near_hits(self):
+        """Test that int8 storage still distinguishes near hits from misses."""
+        cache = ProximityCache(threshold=0.05, dtype="int8")
+        vector = [0.5, -0.25, 0.8, 0.1]
+        cache.put("memories", vector, ["result"])
+        assert cache.get("memories", vector) == ["result"]
+        assert cache.get("memories", [-0.5, 0.25, -0.8, -0.1]) is None
+
+    def test_pq_dtype_trains_and_still_hits(self):
+        """Test that the pq mode keeps serving hits after codebook training."""
+        rng = np.random.default_rng(42)
+        cache = ProximityCache(threshold=0.05, dtype="pq", pq_train_size=8)
+        vectors = rng.normal(size=(10, 16)).astype(np.float32)
+        for i, vector in enumerate(vectors):
+            cache.put("memories", vector, [f"result-{i}"])
+        assert cache._pq.trained
+        assert cache.get("memories", vectors[3]) == ["result-3"]
+        assert cache.get("memories", -vectors[3]) is None
+
+    def test_invalidate(self):
+        """Test that invalidation drops all entries for a collection."""
+        cache = ProximityCache()
+        cache.put("memories", [1.0, 0.0, 0.0], ["result"])
+        cache.invalidate("memories")
+        assert cache.get("memories", [1.0, 0.0, 0.0]) is None
+
+    def test_invalidate_prefix(self):
+        """Test that prefix invalidation drops all matching cache keys."""
+        cache = ProximityCache()
+        cache.put("memories|10|0.0", [1.0, 0.0, 0.0], ["a"])
+        cache.put("memories|20|0.5", [1.0, 0.0, 0.0], ["b"])
+        cache.put("other|10|0.0", [1.0, 0.0, 0.0], ["c"])
+        cache.invalidate_prefix("memories|")
+        assert cache.get("memories|10|0.0", [1.0, 0.0, 0.0]) is None
+        assert cache.get("memories|20|0.5", [1.0, 0.0, 0.0]) is None
+        assert cache.get("other|10|0.0", [1.0, 0.0, 0.0]) == ["c"]